@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tools live as plain scripts in Codes/, not as an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Codes"))
@@ -0,0 +1,64 @@
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import MatrixCalculator, _serve_batch
+
+
+def hilbert(n):
+    return [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        [[2, 1, 0], [1, 3, 1], [0, 1, 4]],
+        [[10**20 + 1, 10**20], [10**20, 10**20 - 1]],
+        hilbert(6),
+        [[Fraction(1, 3), 2], [5, Fraction(7, 2)]],
+    ],
+)
+def test_exact_input_keeps_its_exact_type(matrix):
+    exact, _ = MatrixCalculator.determinant_bareiss(matrix)
+    det, _ = MatrixCalculator.determinant_adaptive(matrix)
+    assert det == exact
+    assert type(det) is type(exact)
+
+
+def test_float_input_stays_float():
+    det, _ = MatrixCalculator.determinant_adaptive([[2.0, 1.0], [1.0, 3.0]])
+    assert det == pytest.approx(5.0) and isinstance(det, float)
+
+
+def test_decimal_bound_survives_past_float_range(monkeypatch):
+    # A tolerance this tight pushes the decimal stage past 324 digits,
+    # where ½·10^(1-digits) used to flush to 0.0 and certify anything
+    monkeypatch.setattr(MatrixCalculator, "ADAPTIVE_TOLERANCE", 1e-320)
+    det, steps = MatrixCalculator.determinant_adaptive(
+        [[1.0, 1.0], [1.0, 1.0 + 2**-30]], show_steps=True
+    )
+    assert det == pytest.approx(2**-30)
+    digits = next(int(s.split()[5]) for s in steps if "decimal at" in s)
+    assert digits > 324
+    assert not any("relative error ≤ 0.00e+00" in step for step in steps)
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        [[10**400, 1], [1, 1]],
+        [[Fraction(10**400, 3), 1], [2, 5]],
+    ],
+)
+def test_entries_beyond_float_range_go_exact(matrix):
+    exact, _ = MatrixCalculator.determinant_bareiss(matrix)
+    det, steps = MatrixCalculator.determinant_adaptive(matrix, show_steps=True)
+    assert det == exact
+    assert any("overflow a float" in step for step in steps)
+
+
+def test_service_answers_beyond_float_range():
+    matrix = [[10**400, 1], [1, 1]]
+    for endpoint in ("/det", "/analyze"):
+        (result,) = _serve_batch([(endpoint, matrix, "adaptive")])
+        assert "error" not in result and result["sign"] == 1
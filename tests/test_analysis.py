@@ -0,0 +1,27 @@
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import MatrixAnalyzer, modular_primes
+
+
+def test_engine_without_a_log_keeps_its_name():
+    analysis = MatrixAnalyzer.analyze_matrix([[1, 2], [3, 4]], "recursive")
+    assert analysis.method == "recursive"
+    assert analysis.determinant == -2
+    assert analysis.calculation_steps()  # the shared LU factors' steps
+
+
+@pytest.mark.parametrize(
+    "matrix, rank",
+    [
+        # Rank 1 over Q, but 0 modulo the first CRT prime
+        ([[modular_primes(1)[0] * 10**400, 0], [0, 0]], 1),
+        ([[10**400, 2 * 10**400, 1], [1, 2, 0], [10**400 + 1, 2 * 10**400 + 2, 1]], 2),
+        ([[Fraction(10**400, 3), 1], [Fraction(2 * 10**400, 3), 2]], 1),
+    ],
+)
+def test_singular_rank_past_float_range_is_exact(matrix, rank):
+    analysis = MatrixAnalyzer.analyze_matrix(matrix, "auto")
+    assert analysis.determinant == 0
+    assert analysis.rank == rank
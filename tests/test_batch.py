@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from matrix_wizard import PROGRESS, BatchRunner, iter_batch_records, np
+
+
+def run(lines: bytes, **options):
+    runner = BatchRunner(workers=1, **options)
+    output = io.StringIO()
+    runner.run(iter_batch_records(io.BufferedReader(io.BytesIO(lines))), output)
+    return runner, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_results_stay_in_input_order_with_ids_and_errors():
+    lines = b"\n".join(
+        [
+            b"[[1, 2], [3, 4]]",
+            b'{"id": "b", "matrix": [[2, 0], [0, 3]], "method": "bareiss"}',
+            b"not json",
+            b'{"matrix": [[1, 2], [3, 4]], "method": "nope"}',
+            b'{"matrix": [["1/2", 0], [0, 4]], "exact": true}',
+        ]
+    )
+    runner, results = run(lines)
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert float(results[0]["determinant"]) == pytest.approx(-2)
+    assert results[1] == dict(results[1], id="b", determinant="6")
+    assert "error" in results[2] and "error" in results[3]
+    assert results[4]["determinant"] == "2"
+    assert runner.records == 5 and runner.errors == 2
+
+
+def test_analyze_records():
+    _, (result,) = run(b"[[2, 1], [1, 2]]", analyze=True)
+    assert result["rank"] == 2 and result["is_symmetric"]
+
+
+def test_progress_is_reported_per_item(monkeypatch):
+    monkeypatch.setattr(PROGRESS, "interval", 0.0)
+    events = []
+    with PROGRESS.listen(lambda stage, fraction: events.append((stage, fraction))):
+        run(b"[[1, 2], [3, 4]]\n[[2]]\n[[1, 0], [0, 1]]")
+    assert [fraction for stage, fraction in events if stage == "batch"] == [
+        1 / 3,
+        2 / 3,
+        1.0,
+    ]
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+def test_npy_stack():
+    stream = io.BytesIO()
+    np.save(stream, np.array([[[1.0, 2.0], [3.0, 4.0]], [[2.0, 0.0], [0.0, 2.0]]]))
+    _, results = run(stream.getvalue())
+    assert [float(r["determinant"]) for r in results] == pytest.approx([-2, 4])
@@ -0,0 +1,14 @@
+from matrix_wizard import BenchmarkSuite
+
+
+def test_engines_past_their_size_limit_are_skipped(monkeypatch):
+    monkeypatch.setattr(
+        BenchmarkSuite, "SIZE_LIMITS", {**BenchmarkSuite.SIZE_LIMITS, "modular": 2}
+    )
+    suite = BenchmarkSuite(warmup=0, repeats=1)
+    matrix = [[(i * 7 + j * 3) % 5 + (i == j) for j in range(4)] for i in range(4)]
+    engines = {result.engine for result in suite.run_matrix(matrix, "case")}
+    assert "lu" in engines and "modular" not in engines
+    assert {"case": "case", "engine": "modular", "reason": "too slow past n=2"} in (
+        suite.skipped
+    )
@@ -0,0 +1,78 @@
+import json
+import math
+import os
+import pickle
+from fractions import Fraction
+
+from matrix_wizard import (
+    MatrixAnalyzer,
+    ResultCache,
+    display_matrix_analysis,
+)
+
+
+def test_key_depends_on_backend():
+    matrix = [[1.0, 2.0], [3.0, 4.0]]
+    assert ResultCache.key(matrix, "lu", False, "python") != ResultCache.key(
+        matrix, "lu", False, "numpy"
+    )
+
+
+def test_round_trip_keeps_number_types(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    analysis = MatrixAnalyzer.analyze_matrix(
+        [[Fraction(1, 2), 10**50], [0, Fraction(1, 3)]], "bareiss"
+    )
+    analysis.eigenvalue_estimate = [complex(1, -2), complex(0.5, 0)]
+    analysis.condition_number = math.inf
+    cache.put("k" * 64, analysis)
+
+    loaded = cache.get("k" * 64)
+    assert loaded.determinant == Fraction(1, 6)
+    assert type(loaded.determinant) is Fraction
+    assert loaded.trace == Fraction(5, 6)
+    assert loaded.eigenvalue_estimate == [complex(1, -2), complex(0.5, 0)]
+    assert loaded.condition_number == math.inf
+    assert loaded.structure == analysis.structure
+    assert loaded.slogdet == analysis.slogdet
+    assert loaded.method == "bareiss"
+
+    with open(os.path.join(tmp_path, "k" * 64 + ".json")) as f:
+        json.load(f)  # plain JSON on disk
+
+
+def test_numbers_past_str_digit_limit_round_trip():
+    for value in (-(10**5000), Fraction(1, 10**5000 + 1)):
+        encoded = json.loads(json.dumps(ResultCache._encode(value)))
+        assert ResultCache._decode(encoded) == value
+
+
+def test_pickle_in_cache_dir_is_never_loaded(tmp_path):
+    class Boom:
+        def __reduce__(self):
+            return (os.remove, (str(tmp_path / "canary"),))
+
+    (tmp_path / "canary").write_text("alive")
+    key = "a" * 64
+    (tmp_path / f"{key}.json").write_bytes(pickle.dumps(Boom()))
+
+    assert ResultCache(str(tmp_path)).get(key) is None
+    assert (tmp_path / "canary").exists()
+
+
+def test_eviction_leaves_foreign_files_alone(tmp_path):
+    (tmp_path / "notes.json").write_text("{}")
+    cache = ResultCache(str(tmp_path), max_bytes=0)
+    cache.put("b" * 64, MatrixAnalyzer.analyze_matrix([[2.0]]))
+    assert os.listdir(tmp_path) == ["notes.json"]
+
+
+def test_cached_steps_titled_by_producing_engine(tmp_path, capsys):
+    # Dense general input: auto finds no fast path and falls back to LU
+    matrix = [[4.0, 1.0, 2.0], [1.0, 5.0, 3.0], [2.0, 3.0, 6.0]]
+    cache = ResultCache(str(tmp_path))
+    cache.put("c" * 64, MatrixAnalyzer.analyze_matrix(matrix, "auto"), True)
+
+    display_matrix_analysis(matrix, cache.get("c" * 64, need_steps=True), True)
+    out = capsys.readouterr().out
+    assert "Calculation Steps (LU Decomposition)" in out
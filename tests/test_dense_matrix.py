@@ -0,0 +1,64 @@
+import pytest
+
+from matrix_wizard import Matrix, MatrixAnalyzer, MatrixCalculator
+
+
+def block_diagonal():
+    return Matrix.from_rows(
+        [
+            [2.0, 1.0, 0.0, 0.0],
+            [1.0, 3.0, 0.0, 0.0],
+            [0.0, 0.0, 4.0, 1.5],
+            [0.0, 0.0, 2.0, 5.0],
+        ]
+    )
+
+
+def test_slicing_returns_row_views():
+    m = block_diagonal()
+    rows = m[1:3]
+    assert [row.tolist() for row in rows] == [
+        [1.0, 3.0, 0.0, 0.0],
+        [0.0, 0.0, 4.0, 1.5],
+    ]
+    rows[0][0] = 7.0
+    assert m[1][0] == 7.0
+
+
+def test_block_diagonal_matrix_through_auto_analysis():
+    analysis = MatrixAnalyzer.analyze_matrix(block_diagonal(), "auto")
+    assert analysis.structure.is_block_diagonal
+    assert analysis.determinant == pytest.approx(5.0 * 17.0)
+    assert not analysis.is_singular
+
+
+def structured_det(rows):
+    matrix = Matrix.from_rows([[float(cell) for cell in row] for row in rows])
+    det, steps = MatrixCalculator.determinant(matrix, "auto", show_steps=True)
+    exact, _ = MatrixCalculator.determinant_bareiss(rows)
+    assert det == pytest.approx(exact)
+    return steps[0]
+
+
+def test_triangular_fast_path():
+    rows = [[2, 5, 1], [0, 3, 7], [0, 0, -4]]
+    assert "Triangular" in structured_det(rows)
+
+
+def test_permutation_fast_path():
+    rows = [[0, 1, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 0, 1, 0]]
+    assert "Permutation" in structured_det(rows)
+
+
+def test_banded_fast_path():
+    n = 12
+    rows = [
+        [4 if i == j else (-1 if abs(i - j) == 1 else 0) for j in range(n)]
+        for i in range(n)
+    ]
+    assert "Banded" in structured_det(rows)
+
+
+def test_block_diagonal_fast_path():
+    rows = [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0], [0.0, 0.0, 5.0]]
+    assert "Block diagonal" in structured_det(rows)
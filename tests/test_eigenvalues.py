@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from matrix_wizard import EigenSolver, MatrixAnalyzer
+
+
+def random_matrix(n, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+
+
+def test_eigenvalues_multiply_to_determinant():
+    matrix = random_matrix(6)
+    analysis = MatrixAnalyzer.analyze_matrix(matrix)
+    product = 1
+    for value in analysis.eigenvalue_estimate:
+        product *= value
+    assert product.real == pytest.approx(analysis.determinant)
+    assert product.imag == pytest.approx(0, abs=1e-9)
+
+
+def test_default_analysis_skips_pure_python_eigenvalues_past_limit():
+    matrix = random_matrix(EigenSolver.PYTHON_LIMIT + 1)
+    assert MatrixAnalyzer.analyze_matrix(matrix).eigenvalue_estimate is None
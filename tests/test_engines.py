@@ -0,0 +1,79 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import (
+    STRAIGHT_LINE_DETERMINANTS,
+    Matrix,
+    MatrixCalculator,
+    SparseMatrix,
+    np,
+)
+
+ENGINES = ["lu", "auto", "bareiss", "modular", "recursive", "adaptive"]
+
+
+def random_integer_matrix(n, seed):
+    rng = random.Random(seed)
+    return [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 7, 9])
+@pytest.mark.parametrize("seed", range(3))
+def test_engines_agree_on_random_integer_matrices(n, seed):
+    matrix = random_integer_matrix(n, seed)
+    exact, _ = MatrixCalculator.determinant_bareiss(matrix)
+    for method in ENGINES:
+        det, _ = MatrixCalculator.determinant(matrix, method, workers=1)
+        assert det == pytest.approx(exact, rel=1e-9, abs=1e-9), method
+
+    sparse, _ = MatrixCalculator.determinant(SparseMatrix.from_dense(matrix), "sparse")
+    assert sparse == pytest.approx(exact, rel=1e-9, abs=1e-9)
+    dense = Matrix.from_rows([[float(cell) for cell in row] for row in matrix])
+    assert MatrixCalculator.determinant(dense, "lu")[0] == pytest.approx(exact)
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+def test_numpy_engine_agrees():
+    matrix = random_integer_matrix(12, 7)
+    exact, _ = MatrixCalculator.determinant_bareiss(matrix)
+    assert MatrixCalculator.determinant(matrix, "numpy")[0] == pytest.approx(exact)
+    assert MatrixCalculator.determinant(matrix, "lu", "numpy")[0] == pytest.approx(
+        exact
+    )
+
+
+def test_exact_engines_keep_fractions():
+    matrix = [[Fraction(1, i + j + 1) for j in range(4)] for i in range(4)]
+    for method in ("bareiss", "modular", "recursive", "lu"):
+        det, _ = MatrixCalculator.determinant(matrix, method, workers=1)
+        assert det == Fraction(1, 6048000), method
+
+
+@pytest.mark.parametrize("n", sorted(STRAIGHT_LINE_DETERMINANTS))
+def test_straight_line_code_matches_recursion(n):
+    matrix = random_integer_matrix(n, n)
+    expected = MatrixCalculator.determinant_recursive(matrix)
+    assert STRAIGHT_LINE_DETERMINANTS[n](matrix) == expected
+
+
+def test_empty_factorization_has_unit_determinant():
+    factorization = MatrixCalculator.lu_factorize([])
+    assert factorization.determinant == 1
+    assert factorization.slogdet() == (1.0, 0.0)
+
+
+@pytest.mark.parametrize("method", ["lu", "auto", "bareiss", "recursive", "adaptive"])
+def test_empty_matrix_determinant_is_one(method):
+    det, _ = MatrixCalculator.determinant([], method)
+    assert det == 1
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+@pytest.mark.parametrize("k", [1, 2, 3, 4])
+def test_batch_kernels_match_numpy(k):
+    from det_of_matrix import batch_det
+
+    a = np.random.default_rng(k).integers(-9, 10, (5000, k, k)).astype(float)
+    assert np.allclose(batch_det(a), np.linalg.det(a))
@@ -0,0 +1,72 @@
+import csv
+import json
+import math
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import (
+    MatrixAnalyzer,
+    SparseMatrix,
+    export_results,
+    load_matrix_from_bigint,
+    np,
+)
+
+MATRIX = [[2, -1, 0], [-1, 2, -1], [0, -1, 2]]
+
+
+def test_json_export(tmp_path):
+    path = tmp_path / "out.json"
+    export_results(MATRIX, MatrixAnalyzer.analyze_matrix(MATRIX), str(path))
+    data = json.loads(path.read_text())
+    assert data["matrix"] == [[str(cell) for cell in row] for row in MATRIX]
+    assert float(data["determinant"]) == pytest.approx(4)
+    assert data["sign"] == 1
+    assert data["log_abs_determinant"] == pytest.approx(math.log(4))
+    assert data["rank"] == 3 and data["is_symmetric"]
+
+
+def test_json_export_of_overflowed_determinant(tmp_path):
+    n = 400
+    matrix = [[10.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    path = tmp_path / "big.json"
+    export_results(matrix, MatrixAnalyzer.analyze_matrix(matrix), str(path))
+    data = json.loads(path.read_text())
+    assert data["determinant"] == "1e+400"
+    assert data["log_abs_determinant"] == pytest.approx(400 * math.log(10))
+
+
+def test_sparse_json_export_lists_entries(tmp_path):
+    matrix = SparseMatrix.from_dense(MATRIX)
+    path = tmp_path / "sparse.json"
+    export_results(matrix, MatrixAnalyzer.analyze_matrix(matrix), str(path))
+    data = json.loads(path.read_text())
+    assert data["matrix"]["size"] == 3
+    assert len(data["matrix"]["entries"]) == 7
+
+
+def test_csv_export(tmp_path):
+    path = tmp_path / "out.csv"
+    export_results(MATRIX, MatrixAnalyzer.analyze_matrix(MATRIX), str(path))
+    rows = list(csv.reader(path.open()))
+    properties = dict(row for row in rows if len(row) == 2)
+    assert float(properties["Determinant"]) == pytest.approx(4)
+    assert properties["Rank"] == "3"
+
+
+def test_bigint_export_round_trips_exactly(tmp_path):
+    matrix = [[Fraction(1, 3), 10**60], [-(10**45), Fraction(-7, 2)]]
+    analysis = MatrixAnalyzer.analyze_matrix(matrix, "bareiss")
+    path = tmp_path / "out.mwb"
+    export_results(matrix, analysis, str(path))
+    assert load_matrix_from_bigint(str(path), exact_mode=True) == matrix
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+def test_npz_export(tmp_path):
+    path = tmp_path / "out.npz"
+    export_results(MATRIX, MatrixAnalyzer.analyze_matrix(MATRIX), str(path))
+    with np.load(path) as data:
+        assert np.array_equal(data["matrix"], np.array(MATRIX, dtype=float))
+        assert int(data["rank"]) == 3
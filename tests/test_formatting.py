@@ -0,0 +1,36 @@
+import math
+from fractions import Fraction
+
+from matrix_wizard import MatrixAnalyzer, MatrixFormatter
+
+
+def test_small_integers_print_exactly():
+    assert MatrixFormatter.format_number(-360) == "-360"
+    assert MatrixFormatter.format_number(Fraction(1, 2160)) == "1/2160"
+
+
+def test_huge_integers_print_in_scientific_notation():
+    # str() raises ValueError past 4300 digits
+    assert MatrixFormatter.format_number(-3 * 10**5000) == "-3e+5000"
+    assert MatrixFormatter.format_number(Fraction(1, 10**5000)) == "1e-5000"
+
+
+def test_slogdet_formatting():
+    assert MatrixFormatter.format_slogdet(-1.0, 400 * math.log(10)) == "-1e+400"
+    assert MatrixFormatter.format_slogdet(1.0, -500 * math.log(10)) == "1e-500"
+    assert MatrixFormatter.format_slogdet(0.0, -math.inf) == "0"
+    # A mantissa that rounds up to 10 carries into the exponent
+    assert MatrixFormatter.format_slogdet(1.0, math.log(9.9999999)) == "1e+1"
+
+
+def test_overflowed_float_determinant_prints_from_slogdet():
+    n = 400
+    matrix = [[10.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    analysis = MatrixAnalyzer.analyze_matrix(matrix, "lu")
+    assert math.isinf(analysis.determinant)
+    assert MatrixFormatter.format_determinant(analysis) == "1e+400"
+
+    tiny = [[0.1 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    analysis = MatrixAnalyzer.analyze_matrix(tiny, "lu")
+    assert analysis.determinant == 0.0 and not analysis.is_singular
+    assert MatrixFormatter.format_determinant(analysis) == "1e-400"
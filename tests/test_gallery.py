@@ -0,0 +1,43 @@
+import math
+from fractions import Fraction
+
+import pytest
+
+import matrix_wizard
+from matrix_wizard import MatrixGallery, np, relative_error
+
+needs_numpy = pytest.mark.skipif(np is None, reason="NumPy not installed")
+
+
+def run_cli(monkeypatch, capsys, *argv):
+    monkeypatch.setattr("sys.argv", ["matrix_wizard.py", *argv])
+    matrix_wizard.main()
+    return capsys.readouterr().out
+
+
+def test_relative_error():
+    assert relative_error(1, 1.5) == 0.5
+    assert relative_error(0, -0.25) == 0.25
+    assert relative_error(Fraction(1, 3), Fraction(1, 3)) == 0
+    assert relative_error(1, math.inf) == math.inf
+
+
+@needs_numpy
+def test_integer_family_verified_exactly(monkeypatch, capsys):
+    out = run_cli(monkeypatch, capsys, "--gallery", "pascal:12")
+    assert "(Bareiss, exact)" in out
+    assert "PASSED" in out
+
+
+def test_failed_verification_shows_full_precision(monkeypatch, capsys):
+    out = run_cli(monkeypatch, capsys, "--gallery", "rotation_2d")
+    assert "0.99969799999999986" in out
+    assert "Rel. err:" in out and "FAILED" in out
+
+
+@needs_numpy
+def test_sparse_family_past_float_range(monkeypatch, capsys):
+    info = MatrixGallery.get_matrix("sparse:2000:1")
+    assert abs(info["expected_det"]).bit_length() > 1024
+    out = run_cli(monkeypatch, capsys, "--gallery", "sparse:2000:1")
+    assert "PASSED" in out
@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import pytest
+
+import matrix_wizard
+from matrix_wizard import DeterminantService, _serve_batch
+
+
+@pytest.fixture
+def service():
+    service = DeterminantService(workers=1)
+    yield service
+    service.pool.shutdown()
+
+
+def exchange(service, raw: bytes):
+    """Send one raw request to a live server and return (status, payload)"""
+
+    async def run():
+        server = await asyncio.start_server(service._handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(body)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "1_0", "²"])
+def test_invalid_content_length_is_rejected(service, length):
+    raw = f"POST /det HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode()
+    status, payload = exchange(service, raw)
+    assert status == 400
+    assert payload["error"] == "invalid Content-Length"
+
+
+def test_oversized_body_is_rejected(service):
+    raw = f"POST /det HTTP/1.1\r\nContent-Length: {service.MAX_BODY + 1}\r\n\r\n"
+    status, _ = exchange(service, raw.encode())
+    assert status == 413
+
+
+def test_route_maps_errors_to_status(service):
+    async def route(body, result):
+        async def submit(*job):
+            return result
+
+        service.submit = submit
+        return await service._route("POST", "/det", json.dumps(body).encode())
+
+    ok = {"matrix": [[1, 2], [3, 4]]}
+    assert asyncio.run(route({"matrix": [[1, 2]]}, {}))[0] == 400
+    assert asyncio.run(route(ok, {"determinant": "-2"})) == (200, {"determinant": "-2"})
+    assert asyncio.run(route(ok, {"error": "ValueError: x"}))[0] == 400
+    assert asyncio.run(route(ok, {"error": "TypeError: x", "status": 500})) == (
+        500,
+        {"error": "TypeError: x"},
+    )
+
+
+def test_worker_separates_bad_input_from_internal_failures(monkeypatch):
+    n = matrix_wizard.SERVICE_RECURSIVE_LIMIT + 1
+    identity = [[int(i == j) for j in range(n)] for i in range(n)]
+    (bad,) = _serve_batch([("/det", identity, "recursive")])
+    assert "error" in bad and "status" not in bad
+
+    def broken(*args, **kwargs):
+        raise TypeError("engine bug")
+
+    monkeypatch.setattr(matrix_wizard.MatrixCalculator, "determinant", broken)
+    (failed,) = _serve_batch([("/det", [[1, 2], [3, 4]], "lu")])
+    assert failed == {"error": "TypeError: engine bug", "status": 500}
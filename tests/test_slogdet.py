@@ -0,0 +1,65 @@
+import math
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import (
+    DeterminantTracker,
+    MatrixAnalyzer,
+    MatrixCalculator,
+    MatrixFormatter,
+    _serve_batch,
+    np,
+    pivot_tolerance,
+)
+
+
+def scaled_identity(n, scale):
+    return [[scale if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+
+def test_pivot_tolerance_with_integers_past_float_range():
+    assert pivot_tolerance([[10**400, 1], [1, 1]]) > 10**380
+
+
+def test_analysis_of_integers_past_float_range():
+    analysis = MatrixAnalyzer.analyze_matrix([[10**400, 1], [1, 1]], "lu")
+    assert analysis.determinant == 10**400 - 1
+    assert analysis.rank == 2
+    assert analysis.slogdet[1] == pytest.approx(400 * math.log(10))
+
+    singular = MatrixAnalyzer.analyze_matrix([[10**400, 10**400], [3, 3]], "bareiss")
+    assert singular.determinant == 0
+    assert singular.is_singular and singular.rank == 1
+
+
+@pytest.mark.skipif(np is None, reason="NumPy not installed")
+def test_numpy_slogdet_past_float_range():
+    matrix = scaled_identity(400, 10.0)
+    det, _ = MatrixCalculator.determinant_numpy(matrix)
+    assert math.isinf(det)
+    sign, log_abs_det = MatrixCalculator.slogdet(matrix, "numpy")
+    assert sign == 1 and log_abs_det == pytest.approx(400 * math.log(10))
+
+
+def test_det_endpoint_reports_overflowed_determinant():
+    (result,) = _serve_batch([("/det", scaled_identity(400, 10.0), "lu")])
+    assert result["determinant"] == "1e+400"
+    assert result["sign"] == 1
+    assert result["log_abs_determinant"] == pytest.approx(400 * math.log(10))
+
+
+def test_tracker_carries_slogdet_past_float_range():
+    tracker = DeterminantTracker(scaled_identity(400, 10.0))
+    tracker.update(0, 0, -20.0)
+    assert tracker.slogdet[0] == -1
+    assert MatrixFormatter.format_det(tracker.determinant, tracker.slogdet) == (
+        "-2e+400"
+    )
+
+
+def test_exact_analysis_with_entries_past_float_range():
+    matrix = [[Fraction(1, 2), 10**400], [0, Fraction(1, 3)]]
+    analysis = MatrixAnalyzer.analyze_matrix(matrix, "bareiss")
+    assert analysis.determinant == Fraction(1, 6)
+    assert analysis.condition_number is None
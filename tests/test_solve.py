@@ -0,0 +1,63 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import MatrixAnalyzer, MatrixCalculator, SparseMatrix, np
+
+
+def random_matrix(n, seed):
+    rng = random.Random(seed)
+    return [
+        [rng.uniform(-1, 1) + (n if i == j else 0) for j in range(n)] for i in range(n)
+    ]
+
+
+def residual(matrix, x, b):
+    n, width = len(matrix), len(b[0])
+    return max(
+        abs(sum(matrix[i][k] * x[k][c] for k in range(n)) - b[i][c])
+        for i in range(n)
+        for c in range(width)
+    )
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_solve_many_right_hand_sides(backend):
+    if backend == "numpy" and np is None:
+        pytest.skip("NumPy not installed")
+    matrix = random_matrix(8, 1)
+    rhs = [[float(i + c) for c in range(3)] for i in range(8)]
+    x = MatrixCalculator.solve(matrix, rhs, backend)
+    assert residual(matrix, x, rhs) < 1e-12
+
+
+def test_solve_reuses_analysis_factors():
+    matrix = random_matrix(6, 2)
+    analysis = MatrixAnalyzer.analyze_matrix(matrix)
+    rhs = [[1.0] for _ in range(6)]
+    x = MatrixCalculator.solve(matrix, rhs, factorization=analysis.factorization)
+    assert residual(matrix, x, rhs) < 1e-12
+
+
+def test_exact_inverse():
+    matrix = [[Fraction(1, i + j + 1) for j in range(4)] for i in range(4)]
+    inverse = MatrixCalculator.inverse(matrix)
+    assert all(type(cell) is Fraction for row in inverse for cell in row)
+    identity = [[int(i == j) for j in range(4)] for i in range(4)]
+    assert residual(matrix, inverse, identity) == 0
+    assert inverse[0][0] == 16 and inverse[3][3] == 2800
+
+
+def test_sparse_solve():
+    dense = [[4.0, 1.0, 0.0], [1.0, 4.0, 1.0], [0.0, 1.0, 4.0]]
+    rhs = [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0]]
+    x = MatrixCalculator.solve(SparseMatrix.from_dense(dense), rhs)
+    assert residual(dense, x, rhs) < 1e-12
+
+
+def test_singular_system_raises():
+    with pytest.raises(ValueError):
+        MatrixCalculator.solve([[1, 2], [2, 4]], [[1], [2]])
+    with pytest.raises(ValueError):
+        MatrixCalculator.solve([[1.0, 2.0], [2.0, 4.0]], [[1.0], [2.0]])
@@ -0,0 +1,38 @@
+from fractions import Fraction
+
+import pytest
+
+from matrix_wizard import MatrixAnalyzer, MatrixCalculator, SparseMatrix
+
+
+def bidiagonal(n):
+    entries = {(i, i): 2 for i in range(n)}
+    entries.update({(i, i - 1): 1 for i in range(1, n)})
+    return SparseMatrix.from_dok(n, entries)
+
+
+def test_sparse_steps_render_only_on_request():
+    assert MatrixAnalyzer.analyze_sparse(bidiagonal(5)).steps is None
+    steps = MatrixAnalyzer.analyze_sparse(bidiagonal(5), show_steps=True).steps
+    assert steps and "sparse LU" in steps[0]
+
+
+def test_sparse_determinant_past_str_digit_limit():
+    analysis = MatrixAnalyzer.analyze_matrix(bidiagonal(15000), "sparse")
+    assert analysis.determinant == 2**15000
+    assert analysis.steps is None
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        [[10**400, 1], [1, 1]],
+        [[Fraction(10**400, 3), 0, 1], [0, 2, 0], [1, 0, 1]],
+        [[10**400, 10**400], [1, 1]],
+    ],
+)
+def test_sparse_lu_keeps_huge_entries_exact(matrix):
+    exact, _ = MatrixCalculator.determinant_bareiss(matrix)
+    analysis = MatrixAnalyzer.analyze_sparse(SparseMatrix.from_dense(matrix))
+    assert analysis.determinant == exact
+    assert analysis.rank == (len(matrix) if exact else len(matrix) - 1)